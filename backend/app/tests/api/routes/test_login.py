@@ -1,5 +1,4 @@
-from unittest.mock import patch
-
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
@@ -45,20 +44,17 @@ def test_use_access_token(
     assert "email" in result
 
 
+@pytest.mark.usefixtures("emails_enabled")
 def test_recovery_password(
     client: TestClient, normal_user_token_headers: dict[str, str]
 ) -> None:
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
-    ):
-        email = "test@example.com"
-        r = client.post(
-            f"{settings.API_V1_STR}/password-recovery/{email}",
-            headers=normal_user_token_headers,
-        )
-        assert r.status_code == 200
-        assert r.json() == {"message": "Password recovery email sent"}
+    email = "test@example.com"
+    r = client.post(
+        f"{settings.API_V1_STR}/password-recovery/{email}",
+        headers=normal_user_token_headers,
+    )
+    assert r.status_code == 200
+    assert r.json() == {"message": "Password recovery email sent"}
 
 
 def test_recovery_password_user_not_exits(
@@ -1,5 +1,7 @@
+import uuid
+
 from fastapi.testclient import TestClient
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from app.core.config import settings
 from app.models import User
@@ -19,7 +21,7 @@ def test_create_user(client: TestClient, db: Session) -> None:
 
     data = r.json()
 
-    user = db.exec(select(User).where(User.id == data["id"])).first()
+    user = db.get(User, uuid.UUID(data["id"]))
 
     assert user
     assert user.email == "pollo@listo.com"
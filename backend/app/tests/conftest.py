@@ -1,41 +1,78 @@
 from collections.abc import Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from sqlmodel import Session
 
+from app.api.deps import get_db
+from app.core import security
 from app.core.config import settings
 from app.core.db import engine, init_db
 from app.main import app
-from app.models import Item, User
 from app.tests.utils.user import authentication_token_from_email
 from app.tests.utils.utils import get_superuser_token_headers
 
 
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
-        init_db(session)
-        yield session
-        statement = delete(Item)
-        session.execute(statement)
-        statement = delete(User)
-        session.execute(statement)
-        session.commit()
+    # Run the whole session inside one transaction and roll it back at the
+    # end; commits from the tests and the API only release savepoints
+    with engine.connect() as connection:
+        transaction = connection.begin()
 
+        def get_test_db() -> Generator[Session, None, None]:
+            with Session(
+                bind=connection, join_transaction_mode="create_savepoint"
+            ) as session:
+                yield session
 
-@pytest.fixture(scope="module")
+        app.dependency_overrides[get_db] = get_test_db
+        with Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            init_db(session)
+            yield session
+        app.dependency_overrides.pop(get_db)
+        transaction.rollback()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing() -> Generator[None, None, None]:
+    # bcrypt's minimum cost; hashes made here never leave the test database
+    with patch.object(
+        security, "pwd_context", security.pwd_context.copy(bcrypt__rounds=4)
+    ):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def smtp_send() -> Generator[MagicMock, None, None]:
+    with patch("app.utils.emails.Message.send") as send:
+        yield send
+
+
+@pytest.fixture()
+def emails_enabled() -> Generator[None, None, None]:
+    with (
+        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
+        patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return get_superuser_token_headers(client)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db